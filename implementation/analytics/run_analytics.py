@@ -6,7 +6,7 @@ import logging
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import List, Sequence
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 DB_PATH = PROJECT_ROOT / "ecommerce.db"
@@ -14,6 +14,9 @@ VIEWS_DIR = Path(__file__).resolve().parent / "views"
 PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
 LOG_DIR = PROJECT_ROOT / "logs"
 LOG_FILE = LOG_DIR / "analytics.log"
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB; keeps CSV emission to a few large writes
+PREVIEW_ROWS = 5
+FETCH_BATCH_SIZE = 4096
 
 VIEW_CONFIG = [
     {
@@ -28,6 +31,15 @@ VIEW_CONFIG = [
     },
 ]
 
+# Statement text per view, built once at import instead of per run.
+PREPARED = {
+    view["name"]: {
+        "drop": f"DROP VIEW IF EXISTS {view['name']}",
+        "select": f"SELECT * FROM {view['name']}",
+    }
+    for view in VIEW_CONFIG
+}
+
 
 def utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -53,32 +65,46 @@ def read_sql(path: Path) -> str:
 
 def compile_view(conn: sqlite3.Connection, view_name: str, sql_text: str) -> None:
     logging.info("%s | compiling view=%s", utc_now(), view_name)
-    conn.execute(f"DROP VIEW IF EXISTS {view_name}")
-    conn.executescript(sql_text)
+    conn.execute(PREPARED[view_name]["drop"])
+    # executescript would force a COMMIT per view; run each statement inside
+    # the enclosing transaction instead.
+    for statement in sql_text.split(";"):
+        if statement.strip():
+            conn.execute(statement)
     logging.info("%s | compiled view=%s successfully", utc_now(), view_name)
 
 
-def query_view(conn: sqlite3.Connection, view_name: str) -> tuple[List[str], List[sqlite3.Row]]:
-    cursor = conn.execute(f"SELECT * FROM {view_name}")
-    rows = cursor.fetchall()
+def query_view(conn: sqlite3.Connection, view_name: str) -> tuple[List[str], sqlite3.Cursor]:
+    cursor = conn.execute(PREPARED[view_name]["select"])
     columns = [desc[0] for desc in cursor.description]
-    return columns, rows
+    return columns, cursor
 
 
-def export_csv(columns: Sequence[str], rows: Iterable[sqlite3.Row], output_path: Path) -> None:
+def export_csv(
+    columns: Sequence[str], cursor: sqlite3.Cursor, output_path: Path
+) -> tuple[int, List[tuple]]:
+    """Stream rows from the cursor into the CSV, returning count and preview."""
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", newline="", encoding="utf-8") as csvfile:
+    cursor.arraysize = FETCH_BATCH_SIZE
+    row_count = 0
+    preview: List[tuple] = []
+    with output_path.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(columns)
-        for row in rows:
-            writer.writerow([row[col] for col in columns])
-
-
-def print_preview(view_name: str, columns: Sequence[str], rows: List[sqlite3.Row]) -> None:
-    print(f"{view_name}: {len(rows)} rows")
-    preview = rows[:5]
+        while batch := cursor.fetchmany():
+            writer.writerows(batch)
+            if len(preview) < PREVIEW_ROWS:
+                preview.extend(batch[: PREVIEW_ROWS - len(preview)])
+            row_count += len(batch)
+    return row_count, preview
+
+
+def print_preview(
+    view_name: str, columns: Sequence[str], preview: List[tuple], row_count: int
+) -> None:
+    print(f"{view_name}: {row_count} rows")
     for idx, row in enumerate(preview, start=1):
-        sample = ", ".join(f"{col}={row[col]}" for col in columns)
+        sample = ", ".join(f"{col}={val}" for col, val in zip(columns, row))
         print(f"  {idx}. {sample}")
     if not preview:
         print("  (no rows)")
@@ -93,29 +119,26 @@ def run() -> None:
     logging.info("%s | analytics run started | db=%s", utc_now(), DB_PATH.name)
 
     with sqlite3.connect(DB_PATH) as conn:
-        conn.row_factory = sqlite3.Row
-
+        # One transaction covers every view rebuild; the context manager
+        # commits on success and rolls back on error.
+        conn.execute("BEGIN")
         for view in VIEW_CONFIG:
+            name, sql_file, output = view["name"], view["sql_file"], view["output"]
             try:
-                sql_text = read_sql(view["sql_file"])
-                compile_view(conn, view["name"], sql_text)
-                columns, rows = query_view(conn, view["name"])
-                export_csv(columns, rows, view["output"])
+                sql_text = read_sql(sql_file)
+                compile_view(conn, name, sql_text)
+                columns, cursor = query_view(conn, name)
+                row_count, preview = export_csv(columns, cursor, output)
                 logging.info(
                     "%s | view=%s | rows=%d | output=%s",
                     utc_now(),
-                    view["name"],
-                    len(rows),
-                    view["output"].relative_to(PROJECT_ROOT),
+                    name,
+                    row_count,
+                    output.relative_to(PROJECT_ROOT),
                 )
-                print_preview(view["name"], columns, rows)
+                print_preview(name, columns, preview, row_count)
             except Exception as exc:  # pylint: disable=broad-except
-                logging.error(
-                    "%s | view=%s | error=%s",
-                    utc_now(),
-                    view["name"],
-                    exc,
-                )
+                logging.error("%s | view=%s | error=%s", utc_now(), name, exc)
                 raise
 
     logging.info("%s | analytics run completed", utc_now())
@@ -6,20 +6,22 @@ from pathlib import Path
 
 RAW_DIR = Path(__file__).resolve().parents[2] / "data" / "raw"
 OUTPUT_FILE = RAW_DIR / "plans.csv"
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB; keeps CSV emission to a few large writes
 
 PLANS = [
-    {"plan_id": "1", "name": "Basic", "price": "8.99"},
-    {"plan_id": "2", "name": "Standard", "price": "13.99"},
-    {"plan_id": "3", "name": "Premium", "price": "18.99"},
+    {"plan_id": 1, "name": "Basic", "price": 8.99},
+    {"plan_id": 2, "name": "Standard", "price": 13.99},
+    {"plan_id": 3, "name": "Premium", "price": 18.99},
 ]
 
 
 def write_plans() -> None:
     RAW_DIR.mkdir(parents=True, exist_ok=True)
-    with OUTPUT_FILE.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=["plan_id", "name", "price"])
-        writer.writeheader()
-        writer.writerows(PLANS)
+    fieldnames = ["plan_id", "name", "price"]
+    with OUTPUT_FILE.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows((p["plan_id"], p["name"], p["price"]) for p in PLANS)
     print(f"Generated {len(PLANS)} plans -> {OUTPUT_FILE}")
 
 
@@ -1,11 +1,15 @@
 """Generate synthetic subscriptions data."""
 from __future__ import annotations
 
+import bisect
 import csv
 import random
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 RAW_DIR = Path(__file__).resolve().parents[2] / "data" / "raw"
 CUSTOMERS_FILE = RAW_DIR / "customers.csv"
@@ -13,25 +17,39 @@ PLANS_FILE = RAW_DIR / "plans.csv"
 OUTPUT_FILE = RAW_DIR / "subscriptions.csv"
 NUM_SUBSCRIPTIONS = 1200
 SEED = 45
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB; keeps CSV emission to a few large writes
 MAX_LOOKBACK_DAYS = 548  # ~18 months
 PLAN_WEIGHTS = {"1": 0.4, "2": 0.35, "3": 0.25}
 
 
-def load_csv(path: Path) -> list[dict[str, str]]:
+def load_columns(path: Path, columns: Sequence[str]) -> list[tuple[str, ...]]:
+    """Stream the CSV, keeping only the named columns as positional tuples."""
     if not path.exists():
         raise FileNotFoundError(f"Required file missing: {path}")
     with path.open("r", newline="", encoding="utf-8") as csvfile:
-        return list(csv.DictReader(csvfile))
+        reader = csv.reader(csvfile)
+        header = next(reader)
+        get_fields = itemgetter(*(header.index(col) for col in columns))
+        return [get_fields(row) for row in reader]
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date, memoized since signup dates repeat heavily."""
+    return datetime.fromisoformat(value).date()
+
+
+# Cumulative distribution built once; each pick is a single bisect.
+_PLAN_IDS = list(PLAN_WEIGHTS.keys())
+_PLAN_CUM_WEIGHTS = list(accumulate(PLAN_WEIGHTS.values()))
 
 
 def choose_plan_id() -> str:
-    plan_ids = list(PLAN_WEIGHTS.keys())
-    weights = [PLAN_WEIGHTS[pid] for pid in plan_ids]
-    return random.choices(plan_ids, weights=weights, k=1)[0]
+    point = random.random() * _PLAN_CUM_WEIGHTS[-1]
+    return _PLAN_IDS[bisect.bisect(_PLAN_CUM_WEIGHTS, point)]
 
 
-def random_start(signup_date: datetime.date) -> datetime.date:
-    today = datetime.now(timezone.utc).date()
+def random_start(signup_date: datetime.date, today: datetime.date) -> datetime.date:
     earliest = max(signup_date, today - timedelta(days=MAX_LOOKBACK_DAYS))
     if earliest >= today:
         return today
@@ -40,8 +58,7 @@ def random_start(signup_date: datetime.date) -> datetime.date:
     return earliest + timedelta(days=offset)
 
 
-def determine_end_date(start_date: datetime.date) -> str:
-    today = datetime.now(timezone.utc).date()
+def determine_end_date(start_date: datetime.date, today: datetime.date) -> str:
     if random.random() < 0.3:
         return ""
     duration_days = random.randint(30, 365)
@@ -51,71 +68,74 @@ def determine_end_date(start_date: datetime.date) -> str:
     return end_date.isoformat()
 
 
-def generate_subscriptions() -> list[dict[str, Any]]:
-    RAW_DIR.mkdir(parents=True, exist_ok=True)
+FIELDNAMES = [
+    "subscription_id",
+    "customer_id",
+    "plan_id",
+    "start_date",
+    "end_date",
+    "auto_renew",
+]
+
+
+def generate_subscriptions(writer: "csv._writer") -> tuple[
+    int, dict[str, str], dict[str, Any]
+]:
+    """Generate subscriptions, streaming each row straight to the CSV writer."""
     random.seed(SEED)
 
-    customers = load_csv(CUSTOMERS_FILE)
-    for customer in customers:
-        customer["signup_date"] = datetime.fromisoformat(customer["signup_date"]).date()
-    loads_plans = load_csv(PLANS_FILE)
-    plan_lookup = {plan["plan_id"]: plan["name"] for plan in loads_plans}
+    customers = [
+        (customer_id, _parse_date(signup))
+        for customer_id, signup in load_columns(
+            CUSTOMERS_FILE, ("customer_id", "signup_date")
+        )
+    ]
+    plan_lookup = dict(load_columns(PLANS_FILE, ("plan_id", "name")))
 
-    subscriptions: list[dict[str, Any]] = []
+    plan_counts: dict[str, int] = {pid: 0 for pid in plan_lookup}
+    active = 0
     today = datetime.now(timezone.utc).date()
     for sub_id in range(1, NUM_SUBSCRIPTIONS + 1):
-        customer = random.choice(customers)
+        customer_id, signup_date = random.choice(customers)
         plan_id = choose_plan_id()
-        start_date = random_start(customer["signup_date"])
+        start_date = random_start(signup_date, today)
         if start_date > today:
             start_date = today
-        end_date = determine_end_date(start_date)
-        subscriptions.append(
-            {
-                "subscription_id": str(sub_id),
-                "customer_id": customer["customer_id"],
-                "plan_id": plan_id,
-                "start_date": start_date.isoformat(),
-                "end_date": end_date,
-                "auto_renew": str(random.random() < 0.7),
-            }
+        end_date = determine_end_date(start_date, today)
+        plan_counts[plan_id] += 1
+        active += end_date == ""
+        # Row tuple in fieldname order; written immediately, never retained.
+        writer.writerow(
+            (
+                sub_id,
+                customer_id,
+                plan_id,
+                start_date.isoformat(),
+                end_date,
+                random.random() < 0.7,
+            )
         )
-    return subscriptions, plan_lookup
+    stats = {"plan_counts": plan_counts, "active": active}
+    return NUM_SUBSCRIPTIONS, plan_lookup, stats
 
 
-def write_csv(rows: list[dict[str, Any]]) -> None:
-    fieldnames = [
-        "subscription_id",
-        "customer_id",
-        "plan_id",
-        "start_date",
-        "end_date",
-        "auto_renew",
-    ]
-    with OUTPUT_FILE.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-
-def print_stats(rows: list[dict[str, Any]], plan_lookup: dict[str, str]) -> None:
-    plan_counts: dict[str, int] = {pid: 0 for pid in plan_lookup}
-    active = 0
-    for row in rows:
-        plan_counts[row["plan_id"]] += 1
-        if row["end_date"] == "":
-            active += 1
-    print(f"Generated {len(rows)} subscriptions -> {OUTPUT_FILE}")
-    for pid, count in plan_counts.items():
-        pct = (count / len(rows)) * 100
+def print_stats(
+    total: int, stats: dict[str, Any], plan_lookup: dict[str, str]
+) -> None:
+    print(f"Generated {total} subscriptions -> {OUTPUT_FILE}")
+    for pid, count in stats["plan_counts"].items():
+        pct = (count / total) * 100
         print(f"  {plan_lookup[pid]}: {count} ({pct:.1f}%)")
-    print(f"Active subscriptions (no end_date): {active}")
+    print(f"Active subscriptions (no end_date): {stats['active']}")
 
 
 def main() -> None:
-    rows, plan_lookup = generate_subscriptions()
-    write_csv(rows)
-    print_stats(rows, plan_lookup)
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_FILE.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
+        total, plan_lookup, stats = generate_subscriptions(writer)
+    print_stats(total, stats, plan_lookup)
 
 
 if __name__ == "__main__":
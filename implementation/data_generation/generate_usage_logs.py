@@ -1,12 +1,16 @@
 """Generate synthetic usage logs with behavioral rules."""
 from __future__ import annotations
 
+import bisect
 import csv
 import random
 from collections import defaultdict
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Sequence
 
 RAW_DIR = Path(__file__).resolve().parents[2] / "data" / "raw"
 CUSTOMERS_FILE = RAW_DIR / "customers.csv"
@@ -17,6 +21,7 @@ OUTPUT_FILE = RAW_DIR / "usage_logs.csv"
 
 NUM_LOGS = 20000
 SEED = 46
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB; keeps CSV emission to a few large writes
 LOOKBACK_DAYS = 60
 WEEKEND_BIAS = 0.45  # > 2/7 to reflect higher activity
 PLAN_ACTIVITY_WEIGHTS = {"Basic": 1.0, "Standard": 1.2, "Premium": 1.5}
@@ -27,77 +32,85 @@ PLAN_COMPLETION_BOUNDS = {
 }
 CONTENT_WEIGHTS = {"movie": 0.5, "music": 0.3, "podcast": 0.2}
 
+# Cumulative distribution built once; each genre pick is a single bisect.
+_GENRES = list(CONTENT_WEIGHTS.keys())
+_GENRE_CUM_WEIGHTS = list(accumulate(CONTENT_WEIGHTS.values()))
 
-def load_csv(path: Path) -> list[dict[str, str]]:
+
+def load_columns(path: Path, columns: Sequence[str]) -> list[tuple[str, ...]]:
+    """Stream the CSV, keeping only the named columns as positional tuples."""
     if not path.exists():
         raise FileNotFoundError(f"Required file missing: {path}")
     with path.open("r", newline="", encoding="utf-8") as csvfile:
-        return list(csv.DictReader(csvfile))
-
-
-def group_content_by_genre(content_rows: list[dict[str, str]]) -> dict[str, list[dict[str, Any]]]:
-    grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
-    for row in content_rows:
-        grouped[row["genre"]].append(
-            {
-                "content_id": row["content_id"],
-                "genre": row["genre"],
-                "duration_minutes": int(row["duration_minutes"]),
-                "title": row["title"],
-            }
-        )
+        reader = csv.reader(csvfile)
+        header = next(reader)
+        get_fields = itemgetter(*(header.index(col) for col in columns))
+        return [get_fields(row) for row in reader]
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    """Parse an ISO date, memoized since subscription dates repeat heavily."""
+    return datetime.fromisoformat(value).date()
+
+
+def group_content_by_genre(
+    content_rows: list[tuple[str, ...]]
+) -> dict[str, list[tuple[str, int]]]:
+    """Group (content_id, duration_minutes) pairs by genre."""
+    grouped: dict[str, list[tuple[str, int]]] = defaultdict(list)
+    for content_id, genre, duration_minutes in content_rows:
+        grouped[genre].append((content_id, int(duration_minutes)))
     return grouped
 
 
-def derive_active_plans(sub_rows: list[dict[str, str]], plan_lookup: dict[str, str]) -> dict[str, str]:
+def derive_active_plans(
+    sub_rows: list[tuple[str, ...]], plan_lookup: dict[str, str]
+) -> dict[str, str]:
     """Return latest active plan per customer."""
-    cutoff = datetime.now(timezone.utc).date() - timedelta(days=LOOKBACK_DAYS)
+    today = datetime.now(timezone.utc).date()
+    cutoff = today - timedelta(days=LOOKBACK_DAYS)
     latest_by_customer: dict[str, tuple[datetime.date, str]] = {}
-    for row in sub_rows:
-        start = datetime.fromisoformat(row["start_date"]).date()
-        end_str = row["end_date"]
-        end_date = datetime.fromisoformat(end_str).date() if end_str else None
+    for cust_id, plan_id, start_str, end_str in sub_rows:
+        start = _parse_date(start_str)
+        end_date = _parse_date(end_str) if end_str else None
         if end_date and end_date < cutoff:
             continue
-        if start > datetime.now(timezone.utc).date():
+        if start > today:
             continue
-        cust_id = row["customer_id"]
         existing = latest_by_customer.get(cust_id)
         if existing is None or start > existing[0]:
-            latest_by_customer[cust_id] = (start, plan_lookup[row["plan_id"]])
+            latest_by_customer[cust_id] = (start, plan_lookup[plan_id])
     return {cust_id: plan_name for cust_id, (_, plan_name) in latest_by_customer.items()}
 
 
 def prepare_customer_pool(plan_by_customer: dict[str, str]) -> tuple[list[str], list[float]]:
+    """Return customer ids with cumulative activity weights for batched picks."""
     customers = list(plan_by_customer.keys())
     weights = [PLAN_ACTIVITY_WEIGHTS.get(plan_by_customer[cid], 1.0) for cid in customers]
-    return customers, weights
+    return customers, list(accumulate(weights))
 
 
-def biased_timestamp() -> datetime:
-    now = datetime.now(timezone.utc)
-    attempt_weekend = random.random() < WEEKEND_BIAS
-    for _ in range(5):
-        days_back = random.randint(0, LOOKBACK_DAYS - 1)
-        candidate = now - timedelta(days=days_back)
-        if attempt_weekend and candidate.weekday() < 5:
-            continue
-        if not attempt_weekend and candidate.weekday() >= 5:
-            continue
-        break
-    else:
-        candidate = now - timedelta(days=random.randint(0, LOOKBACK_DAYS - 1))
+def biased_timestamp(
+    weekday_days: list[int], weekend_days: list[int]
+) -> tuple[int, int, int, int]:
+    """Pick (days_back, hour, minute, second) biased toward weekends.
+
+    Picking directly from the matching day pool replaces the old
+    retry-until-match loop, so every draw lands on the intended day type.
+    """
+    pool = weekend_days if random.random() < WEEKEND_BIAS else weekday_days
+    days_back = random.choice(pool)
     hour = random.randint(6, 23)
     minute = random.randint(0, 59)
     second = random.randint(0, 59)
-    return candidate.replace(hour=hour, minute=minute, second=second, microsecond=0)
+    return days_back, hour, minute, second
 
 
-def choose_content(grouped_content: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
-    genres = list(CONTENT_WEIGHTS.keys())
-    weights = [CONTENT_WEIGHTS[g] for g in genres]
+def choose_content(grouped_content: dict[str, list[tuple[str, int]]]) -> tuple[str, int]:
     for _ in range(5):
-        genre = random.choices(genres, weights=weights, k=1)[0]
+        point = random.random() * _GENRE_CUM_WEIGHTS[-1]
+        genre = _GENRES[bisect.bisect(_GENRE_CUM_WEIGHTS, point)]
         if grouped_content.get(genre):
             return random.choice(grouped_content[genre])
     genre = random.choice(list(grouped_content.keys()))
@@ -117,75 +130,94 @@ def compute_duration(plan: str, content_duration: int, is_weekend: bool) -> tupl
     return watched, round(completion, 2)
 
 
-def generate_usage_logs() -> list[dict[str, Any]]:
-    RAW_DIR.mkdir(parents=True, exist_ok=True)
+FIELDNAMES = [
+    "usage_id",
+    "customer_id",
+    "content_id",
+    "timestamp",
+    "duration_watched",
+    "completion_rate",
+]
+
+
+def generate_usage_logs(writer: "csv._writer") -> tuple[
+    int, dict[str, str], dict[str, float]
+]:
+    """Generate usage logs, streaming each row straight to the CSV writer."""
     random.seed(SEED)
 
-    plans = load_csv(PLANS_FILE)
-    plan_lookup = {row["plan_id"]: row["name"] for row in plans}
-    subscriptions = load_csv(SUBSCRIPTIONS_FILE)
+    plan_lookup = dict(load_columns(PLANS_FILE, ("plan_id", "name")))
+    subscriptions = load_columns(
+        SUBSCRIPTIONS_FILE, ("customer_id", "plan_id", "start_date", "end_date")
+    )
     plan_by_customer = derive_active_plans(subscriptions, plan_lookup)
     if not plan_by_customer:
         raise RuntimeError("No active subscriptions found for usage generation.")
 
-    content_rows = load_csv(CONTENT_FILE)
+    content_rows = load_columns(
+        CONTENT_FILE, ("content_id", "genre", "duration_minutes")
+    )
     grouped_content = group_content_by_genre(content_rows)
 
-    customer_ids, customer_weights = prepare_customer_pool(plan_by_customer)
-    logs: list[dict[str, Any]] = []
-
-    for usage_id in range(1, NUM_LOGS + 1):
-        customer_id = random.choices(customer_ids, weights=customer_weights, k=1)[0]
+    customer_ids, customer_cum_weights = prepare_customer_pool(plan_by_customer)
+    customer_picks = random.choices(
+        customer_ids, cum_weights=customer_cum_weights, k=NUM_LOGS
+    )
+    now = datetime.now(timezone.utc)
+    # Only LOOKBACK_DAYS distinct dates exist, so format each date once.
+    dates = [(now - timedelta(days=d)).date() for d in range(LOOKBACK_DAYS)]
+    date_strings = [d.isoformat() for d in dates]
+    weekend_mask = [d.weekday() >= 5 for d in dates]
+    weekend_days = [d for d in range(LOOKBACK_DAYS) if weekend_mask[d]]
+    weekday_days = [d for d in range(LOOKBACK_DAYS) if not weekend_mask[d]]
+
+    weekend_count = 0
+    completion_sum = 0.0
+    for usage_id, customer_id in enumerate(customer_picks, start=1):
         plan_name = plan_by_customer[customer_id]
-        content = choose_content(grouped_content)
-        timestamp = biased_timestamp()
-        is_weekend = timestamp.weekday() >= 5
-        duration_watched, completion = compute_duration(plan_name, content["duration_minutes"], is_weekend)
-        logs.append(
-            {
-                "usage_id": str(usage_id),
-                "customer_id": customer_id,
-                "content_id": content["content_id"],
-                "timestamp": timestamp.isoformat(),
-                "duration_watched": str(duration_watched),
-                "completion_rate": f"{completion:.2f}",
-            }
+        content_id, content_duration = choose_content(grouped_content)
+        days_back, hour, minute, second = biased_timestamp(weekday_days, weekend_days)
+        is_weekend = weekend_mask[days_back]
+        duration_watched, completion = compute_duration(plan_name, content_duration, is_weekend)
+        weekend_count += is_weekend
+        completion_sum += completion
+        # Row tuple in fieldname order; written immediately, never retained.
+        writer.writerow(
+            (
+                usage_id,
+                customer_id,
+                content_id,
+                f"{date_strings[days_back]}T{hour:02d}:{minute:02d}:{second:02d}+00:00",
+                duration_watched,
+                f"{completion:.2f}",
+            )
         )
-    return logs, plan_by_customer
-
-
-def write_csv(rows: list[dict[str, Any]]) -> None:
-    fieldnames = [
-        "usage_id",
-        "customer_id",
-        "content_id",
-        "timestamp",
-        "duration_watched",
-        "completion_rate",
-    ]
-    with OUTPUT_FILE.open("w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-
-
-def print_stats(rows: list[dict[str, Any]], plan_by_customer: dict[str, str]) -> None:
-    weekend_count = sum(1 for row in rows if datetime.fromisoformat(row["timestamp"]).weekday() >= 5)
-    avg_completion = sum(float(row["completion_rate"]) for row in rows) / len(rows)
+    stats = {"weekend_count": weekend_count, "completion_sum": completion_sum}
+    return NUM_LOGS, plan_by_customer, stats
+
+
+def print_stats(
+    total: int, stats: dict[str, float], plan_by_customer: dict[str, str]
+) -> None:
+    weekend_count = stats["weekend_count"]
+    avg_completion = stats["completion_sum"] / total
     plan_freq: dict[str, int] = defaultdict(int)
     for plan in plan_by_customer.values():
         plan_freq[plan] += 1
-    print(f"Generated {len(rows)} usage logs -> {OUTPUT_FILE}")
-    print(f"Weekend events: {weekend_count} ({(weekend_count/len(rows))*100:.1f}%)")
+    print(f"Generated {total} usage logs -> {OUTPUT_FILE}")
+    print(f"Weekend events: {weekend_count} ({(weekend_count/total)*100:.1f}%)")
     print(f"Average completion rate: {avg_completion:.2f}")
     for plan, count in plan_freq.items():
         print(f"Customers with {plan}: {count}")
 
 
 def main() -> None:
-    rows, plan_by_customer = generate_usage_logs()
-    write_csv(rows)
-    print_stats(rows, plan_by_customer)
+    RAW_DIR.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_FILE.open("w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(FIELDNAMES)
+        total, plan_by_customer, stats = generate_usage_logs(writer)
+    print_stats(total, stats, plan_by_customer)
 
 
 if __name__ == "__main__":
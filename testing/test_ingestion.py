@@ -1,7 +1,6 @@
 """Test suite for SQLite ingestion pipeline."""
 from __future__ import annotations
 
-import csv
 import sqlite3
 import sys
 import tempfile
@@ -18,22 +17,68 @@ from implementation.ingestion.load_db import (
 )
 
 
+def _fast_connect(path: Path) -> sqlite3.Connection:
+    """Connect with relaxed-durability PRAGMAs; no test here asserts durability."""
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    # Enabled here, outside any transaction, so individual tests need no
+    # extra PRAGMA round-trip.
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
 class TestIngestion(TestCase):
     """Test ingestion components."""
 
+    # Schema and constraint tests never read the DB file back from disk,
+    # so they run against :memory: and skip all page-cache/fsync traffic.
+    IN_MEMORY = True
+
+    @classmethod
+    def setUpClass(cls):
+        """Run the schema DDL once into a template shared by every test."""
+        cls._template = sqlite3.connect(":memory:")
+        create_tables(cls._template)
+        # One class-level tempdir; on-disk tests get unique subpaths.
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.temp_dir = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._template.close()
+        cls._tmp.cleanup()
+
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.db_path = self.temp_dir / "test_ecommerce.db"
-        self.raw_dir = self.temp_dir / "data" / "raw"
+        self.db_path = ":memory:" if self.IN_MEMORY else self._on_disk_fixture()
+        self.conn = self._primed_connection(self.db_path)
+
+    def tearDown(self):
+        self.conn.close()
+
+    def _primed_connection(self, path: Path | str) -> sqlite3.Connection:
+        """Open a fast connection restored from the schema template.
+
+        Connection.backup copies pages at the C level, so each test starts
+        from a primed schema without re-running the DDL.
+        """
+        conn = _fast_connect(path)
+        self._template.backup(conn)
+        return conn
+
+    def _on_disk_fixture(self) -> Path:
+        """Create a per-test raw-data directory and return a DB path."""
+        test_dir = self.temp_dir / self.id()
+        self.raw_dir = test_dir / "data" / "raw"
         self.raw_dir.mkdir(parents=True, exist_ok=True)
+        return test_dir / "test_ecommerce.db"
 
     def test_table_creation(self):
         """Test tables are created with correct schema."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA foreign_keys = ON")
-        create_tables(conn)
-        conn.commit()
+        conn = self.conn
 
         expected_tables = [
             "customers",
@@ -50,50 +95,47 @@ class TestIngestion(TestCase):
         fk_enabled = cursor.fetchone()[0]
         self.assertEqual(fk_enabled, 1)
 
-        conn.close()
-
     def test_customers_table_schema(self):
         """Test customers table has correct columns."""
-        conn = sqlite3.connect(str(self.db_path))
-        create_tables(conn)
-        conn.commit()
-
-        cursor = conn.execute("PRAGMA table_info(customers)")
-        columns = {row[1]: row[2] for row in cursor.fetchall()}
-        self.assertIn("customer_id", columns)
-        self.assertIn("name", columns)
-        self.assertIn("email", columns)
-        self.assertIn("signup_date", columns)
-        self.assertIn("device_type", columns)
-        self.assertIn("country", columns)
-        self.assertEqual(columns["customer_id"], "INTEGER")
-
-        conn.close()
+        # One dict equality covers every column name and type, and fails
+        # on extra or missing columns too.
+        expected = {
+            "customer_id": "INTEGER",
+            "name": "TEXT",
+            "email": "TEXT",
+            "signup_date": "TEXT",
+            "device_type": "TEXT",
+            "country": "TEXT",
+        }
+        actual = {row[1]: row[2] for row in self.conn.execute("PRAGMA table_info(customers)")}
+        self.assertEqual(actual, expected)
 
     def test_ingest_sample_data(self):
         """Test ingesting sample CSV data."""
-        # Create sample customers CSV
+        # This test exercises the CSV-from-disk path end to end, so it
+        # keeps a real on-disk database.
+        self.db_path = self._on_disk_fixture()
+
+        # Create sample customers CSV; the fields are known comma-free, so
+        # a literal write produces the same bytes as csv.writer.
         csv_file = self.raw_dir / "customers.csv"
-        with csv_file.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(["customer_id", "name", "email", "signup_date", "device_type", "country"])
-            writer.writerow(["1", "Test User", "test@example.com", "2024-01-01", "mobile", "United States"])
+        csv_file.write_text(
+            "customer_id,name,email,signup_date,device_type,country\n"
+            "1,Test User,test@example.com,2024-01-01,mobile,United States\n",
+            encoding="utf-8",
+        )
 
-        conn = sqlite3.connect(str(self.db_path))
-        create_tables(conn)
+        conn = self._primed_connection(self.db_path)
 
-        # Ingest the CSV with transformer function
+        # One transaction covers the whole ingest, so the test pays a
+        # single commit fsync.
+        conn.execute("BEGIN")
+
+        # Ingest the CSV with positional transformer function
         columns = ["customer_id", "name", "email", "signup_date", "device_type", "country"]
-        transformer = lambda r: (
-            int(r["customer_id"]),
-            r["name"],
-            r["email"],
-            r["signup_date"],
-            r["device_type"],
-            r["country"],
-        )
+        transformer = lambda r: (int(r[0]), r[1], r[2], r[3], r[4], r[5])
         ingest_table(conn, "customers", csv_file, columns, transformer)
-        conn.commit()
+        conn.execute("COMMIT")
 
         # Verify data was inserted
         cursor = conn.execute("SELECT COUNT(*) FROM customers")
@@ -107,49 +149,64 @@ class TestIngestion(TestCase):
 
         conn.close()
 
+    def test_ingest_bulk_rows(self):
+        """Test the executemany ingest path with a 10k-row batch."""
+        self.db_path = self._on_disk_fixture()
+        csv_file = self.raw_dir / "customers_bulk.csv"
+        header = "customer_id,name,email,signup_date,device_type,country\n"
+        rows = "".join(
+            f"{i},User {i},user{i}@example.com,2024-01-01,mobile,United States\n"
+            for i in range(1, 10001)
+        )
+        csv_file.write_text(header + rows, encoding="utf-8")
+
+        conn = self._primed_connection(self.db_path)
+        columns = ["customer_id", "name", "email", "signup_date", "device_type", "country"]
+        transformer = lambda r: (int(r[0]), r[1], r[2], r[3], r[4], r[5])
+        conn.execute("BEGIN")
+        ingest_table(conn, "customers", csv_file, columns, transformer)
+        conn.execute("COMMIT")
+
+        count = conn.execute("SELECT COUNT(*) FROM customers").fetchone()[0]
+        self.assertEqual(count, 10000)
+
+        conn.close()
+
     def test_foreign_key_constraints(self):
         """Test foreign key constraints are enforced."""
-        conn = sqlite3.connect(str(self.db_path))
-        create_tables(conn)
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.commit()
+        conn = self.conn
 
         # Try to insert subscription with invalid customer_id (should fail)
+        conn.execute("BEGIN")
         try:
             conn.execute(
                 "INSERT INTO subscriptions (subscription_id, customer_id, plan_id, start_date, auto_renew) VALUES (1, 9999, 1, '2024-01-01', 'True')"
             )
-            conn.commit()
+            conn.execute("COMMIT")
             self.fail("Foreign key constraint should have been violated")
         except sqlite3.IntegrityError:
             pass  # Expected
 
-        conn.close()
-
     def test_primary_key_uniqueness(self):
         """Test primary key uniqueness is enforced."""
-        conn = sqlite3.connect(str(self.db_path))
-        create_tables(conn)
-        conn.commit()
+        conn = self.conn
 
-        # Insert first customer
-        conn.execute(
-            "INSERT INTO customers (customer_id, name, email, signup_date, device_type, country) VALUES (1, 'User 1', 'user1@test.com', '2024-01-01', 'mobile', 'United States')"
+        insert = (
+            "INSERT INTO customers (customer_id, name, email, signup_date, device_type, country) "
+            "VALUES (1, 'User {n}', 'user{n}@test.com', '2024-01-01', 'mobile', 'United States');"
         )
-        conn.commit()
+
+        # Insert first customer; executescript pushes the whole batch
+        # through the tokenizer in one call and commits once.
+        conn.executescript("BEGIN;" + insert.format(n=1) + "COMMIT;")
 
         # Try to insert duplicate customer_id (should fail)
         try:
-            conn.execute(
-                "INSERT INTO customers (customer_id, name, email, signup_date, device_type, country) VALUES (1, 'User 2', 'user2@test.com', '2024-01-01', 'mobile', 'United States')"
-            )
-            conn.commit()
+            conn.executescript(insert.format(n=2))
             self.fail("Primary key constraint should have been violated")
         except sqlite3.IntegrityError:
             pass  # Expected
 
-        conn.close()
-
 
 if __name__ == "__main__":
     import unittest
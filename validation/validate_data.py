@@ -2,29 +2,57 @@
 from __future__ import annotations
 
 import csv
+import io
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
+try:
+    from . import _fast_csv
+except ImportError:  # script execution: validation/ itself is on sys.path
+    import _fast_csv
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 RAW_DIR = PROJECT_ROOT / "data" / "raw"
 LOG_DIR = PROJECT_ROOT / "logs"
 LOG_FILE = LOG_DIR / "validation.log"
 
-DatasetRows = List[dict]
+# Columnar (struct-of-arrays) table: one numpy array per column plus a
+# "_line" array of source line numbers. Numeric and boolean columns get
+# packed dtypes; strings and date objects live in object arrays. This costs
+# a fraction of the memory of a dict per row and keeps the downstream rule
+# checks vectorized.
+DatasetRows = Dict[str, np.ndarray]
 Parser = Callable[[str], object]
 
+# Rows per streamed chunk; keeps schema validation at O(chunk) memory.
+CHUNK_ROWS = 1 << 16
+
+
+def row_count(table: DatasetRows) -> int:
+    """Number of rows in a columnar table."""
+    for column in table.values():
+        return len(column)
+    return 0
 
-def utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+
+logger = logging.getLogger(__name__)
 
 
 def init_logging() -> None:
     LOG_DIR.mkdir(parents=True, exist_ok=True)
+    # Timestamps come from the formatter's cached asctime rather than a
+    # datetime.now().isoformat() per record.
+    logging.Formatter.converter = time.gmtime
     logging.basicConfig(
         level=logging.INFO,
-        format="%(message)s",
+        format="%(asctime)s.%(msecs)03dZ | %(message)s",
+        datefmt="%Y-%m-%dT%H:%M:%S",
         handlers=[
             logging.FileHandler(LOG_FILE, encoding="utf-8"),
             logging.StreamHandler(),
@@ -32,8 +60,17 @@ def init_logging() -> None:
     )
 
 
+# Integer columns land in int64 arrays, so values outside that range must
+# fail parsing (and count the row invalid) rather than overflow _as_table.
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
 def parse_int(value: str) -> int:
-    return int(value)
+    result = int(value)
+    if not _INT64_MIN <= result <= _INT64_MAX:
+        raise ValueError(f"integer out of int64 range: {value}")
+    return result
 
 
 def parse_float(value: str) -> float:
@@ -53,16 +90,67 @@ def parse_optional_date(value: str) -> Optional[date]:
 def parse_datetime(value: str) -> datetime:
     if not value:
         raise ValueError("expected datetime, received empty string")
+    # The usage generator emits fixed-width "YYYY-MM-DDTHH:MM:SS+00:00";
+    # slicing the six fields out directly skips fromisoformat's format
+    # dispatch. The bare 19-char form is handled the same way. datetime()
+    # still range-checks each field, and anything off-width (non-UTC
+    # offsets, fractional seconds, garbage) falls back to the general
+    # parser.
+    size = len(value)
+    if (
+        (size == 19 or (size == 25 and value.endswith("+00:00")))
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[13] == ":"
+        and value[16] == ":"
+    ):
+        try:
+            return datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                tzinfo=timezone.utc if size == 25 else None,
+            )
+        except ValueError:
+            pass
     return datetime.fromisoformat(value)
 
 
+# Accepted boolean literals in their realistic capitalizations; hitting this
+# dict directly avoids the strip/lower allocations on every subscription row.
+_BOOL_MAP = {
+    "true": True, "True": True, "TRUE": True, "1": True,
+    "yes": True, "Yes": True, "YES": True,
+    "false": False, "False": False, "FALSE": False, "0": False,
+    "no": False, "No": False, "NO": False,
+}
+
+
 def parse_bool(value: str) -> bool:
-    normalized = value.strip().lower()
-    if normalized in {"true", "1", "yes"}:
-        return True
-    if normalized in {"false", "0", "no"}:
-        return False
-    raise ValueError(f"invalid boolean literal: {value}")
+    try:
+        return _BOOL_MAP[value]
+    except KeyError:
+        pass
+    try:
+        return _BOOL_MAP[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"invalid boolean literal: {value}") from None
+
+
+# Packed array dtype per parser; columns without an entry (raw strings,
+# datetime objects) are stored as object arrays. Date columns become
+# datetime64[D] — epoch-day integers under the hood — with missing end
+# dates mapping to NaT, so date comparisons vectorize.
+_COLUMN_DTYPES = {
+    parse_int: np.int64,
+    parse_float: np.float64,
+    parse_bool: np.bool_,
+    parse_date: np.dtype("datetime64[D]"),
+    parse_optional_date: np.dtype("datetime64[D]"),
+}
 
 
 SCHEMA_CONFIG = {
@@ -138,119 +226,413 @@ SCHEMA_CONFIG = {
 }
 
 
-def log_row_error(dataset: str, line_number: int, message: str) -> None:
-    logging.error("%s | %s | line=%d | %s", utc_now(), dataset, line_number, message)
+# The schemas are static, so resolve each dataset's parsers into a tuple
+# aligned with its column order once at import; the row loop then iterates
+# the tuple instead of hashing column names into the parsers dict.
+for _cfg in SCHEMA_CONFIG.values():
+    _cfg["parser_tuple"] = tuple(_cfg["parsers"].get(col) for col in _cfg["columns"])
+del _cfg
 
 
-def load_and_validate_schema(dataset: str) -> Tuple[DatasetRows, int]:
-    config = SCHEMA_CONFIG[dataset]
-    path: Path = config["path"]
-    if not path.exists():
-        raise FileNotFoundError(f"Required dataset missing: {dataset} -> {path}")
+# A buffered row error is a %-style template plus its argument tuple;
+# formatting is deferred until flush so the hot loops only append
+# primitives.
+RowError = Tuple[str, tuple]
+
+
+def flush_row_errors(errors: List[RowError]) -> None:
+    """Emit buffered per-row error lines as a single log record.
+
+    A logging call per invalid row means a lock acquisition and a file
+    flush per row; joining the buffered lines first keeps that to one
+    emit per dataset however many rows failed. The %-formatting of each
+    line happens here rather than at append time.
+    """
+    if errors:
+        logger.error("%s", "\n".join(template % args for template, args in errors))
 
-    with path.open("r", newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
+
+def _iter_usage_fast_chunks(config: dict, chunk_rows: int):
+    """Yield usage_logs chunks from the numba byte-buffer kernels.
+
+    The kernels hand back packed numeric arrays plus timestamp byte
+    offsets; only the rows of the chunk being yielded get their timestamp
+    slice decoded and parsed into Python objects, so per-row objects stay
+    O(chunk_rows) even though the numeric arrays cover the whole file.
+    """
+    expected_columns = config["columns"]
+    header, n_rows, ints, floats, data, ts_bounds, bad_col = _fast_csv.parse_usage_file(
+        config["path"]
+    )
+    header_cols = header.split(",")
+    if header_cols != expected_columns:
+        raise ValueError(
+            f"usage_logs column mismatch. expected={expected_columns} got={header_cols}"
+        )
+
+    for chunk_start in range(0, max(n_rows, 1), chunk_rows):
+        chunk_stop = min(chunk_start + chunk_rows, n_rows)
+        # Row index encodes the source line (r + 2); no per-row bookkeeping.
+        ok = bad_col[chunk_start:chunk_stop] < 0
+        errors: List[RowError] = [
+            (
+                "usage_logs | line=%d | %s: invalid field",
+                (chunk_start + r + 2, expected_columns[bad_col[chunk_start + r]]),
+            )
+            for r in np.flatnonzero(~ok)
+        ]
+        parsed_timestamps: List[datetime] = []
+        for r in np.flatnonzero(ok):
+            row = chunk_start + r
+            begin, end = ts_bounds[row]
+            try:
+                parsed_timestamps.append(parse_datetime(data[begin:end].decode("utf-8")))
+            except ValueError as exc:
+                ok[r] = False
+                errors.append(("usage_logs | line=%d | timestamp: %s", (row + 2, exc)))
+
+        invalid_count = int((chunk_stop - chunk_start) - int(ok.sum()))
+        idx = np.flatnonzero(ok) + chunk_start
+        table: DatasetRows = {
+            "usage_id": ints[idx, 0],
+            "customer_id": ints[idx, 1],
+            "content_id": ints[idx, 2],
+            "timestamp": np.array(parsed_timestamps, dtype=object),
+            "duration_watched": ints[idx, 3],
+            "completion_rate": floats[idx],
+            "_line": idx + 2,
+        }
+
+        flush_row_errors(errors)
+        yield table, invalid_count
+
+
+def _build_row_parser(dataset: str, config: dict) -> Callable[[List[str]], list]:
+    """Generate a straight-line parser for one dataset's row layout.
+
+    The schema is fixed at import time, so the per-column dispatch loop can
+    be collapsed into a single generated expression list — e.g.
+    ``[_p0(row[0]), row[1], _p3(row[3])]`` — with the parser callables
+    bound as argument defaults to skip global lookups. The compiled
+    function is cached on the config dict. Callers fall back to
+    _failing_column for the error message when it raises.
+    """
+    try:
+        return config["row_parser"]
+    except KeyError:
+        pass
+    params = ["row"]
+    bindings = {}
+    items = []
+    for index, parser in enumerate(config["parser_tuple"]):
+        if parser is None:
+            items.append(f"row[{index}]")
+        else:
+            name = f"_p{index}"
+            params.append(f"{name}={name}")
+            bindings[name] = parser
+            items.append(f"{name}(row[{index}])")
+    source = f"def _row_parser({', '.join(params)}):\n    return [{', '.join(items)}]"
+    namespace = dict(bindings)
+    exec(compile(source, f"<row_parser:{dataset}>", "exec"), namespace)
+    config["row_parser"] = namespace["_row_parser"]
+    return config["row_parser"]
+
+
+# Compile every dataset's generated parser once at import. The exec'd
+# functions can't be pickled; forked workers inherit them and spawned
+# workers rebuild them by re-running this loop at import. Compiling here
+# instead of on first chunk also keeps CLI cold starts uniform.
+for _name, _cfg in SCHEMA_CONFIG.items():
+    _build_row_parser(_name, _cfg)
+del _name, _cfg
+
+
+def _failing_column(row, parser_tuple, expected_columns) -> str:
+    """Re-parse a failed row column by column to name the bad field."""
+    for index, (value, parser) in enumerate(zip(row, parser_tuple)):
+        if parser:
+            try:
+                parser(value)
+            except Exception as exc:  # pylint: disable=broad-except
+                return f"{expected_columns[index]}: {exc}"
+    return "unparsable row"
+
+
+def _as_table(expected_columns, parser_tuple, out_lists, first_line, kept, lines) -> DatasetRows:
+    """Pack accumulated per-column value lists into a columnar table.
+
+    lines is None while no row in the chunk has been dropped — the common
+    case — and the _line column is then just an arange from first_line, so
+    clean chunks never pay a per-row line-number append.
+    """
+    table: DatasetRows = {
+        col: np.array(values, dtype=_COLUMN_DTYPES.get(parser, object))
+        for col, parser, values in zip(expected_columns, parser_tuple, out_lists)
+    }
+    if lines is None:
+        table["_line"] = np.arange(first_line, first_line + kept, dtype=np.int64)
+    else:
+        table["_line"] = np.array(lines, dtype=np.int64)
+    return table
+
+
+def _iter_csv_chunks(dataset: str, config: dict, chunk_rows: int):
+    """Yield (table, invalid_count) chunks from the generic csv path."""
+    path: Path = config["path"]
+    # A 4 MiB read buffer instead of the default 8 KiB keeps the reader off
+    # the syscall path for the larger files.
+    with open(path, "rb", buffering=1 << 22) as raw, io.TextIOWrapper(
+        raw, encoding="utf-8", newline=""
+    ) as csvfile:
+        # Positional csv.reader rows; DictReader's per-row dict build and
+        # per-cell key hashing are pure overhead once the header is checked.
+        reader = csv.reader(csvfile)
+        header = next(reader, None)
         expected_columns = config["columns"]
-        if reader.fieldnames is None:
+        if header is None:
             raise ValueError(f"{dataset} has no header row")
-        if reader.fieldnames != expected_columns:
+        if header != expected_columns:
             raise ValueError(
-                f"{dataset} column mismatch. expected={expected_columns} got={reader.fieldnames}"
+                f"{dataset} column mismatch. expected={expected_columns} got={header}"
             )
 
-        parsers: Dict[str, Parser] = config["parsers"]
-        valid_rows: DatasetRows = []
+        parser_tuple: Tuple[Optional[Parser], ...] = config["parser_tuple"]
+        out_lists: List[list] = [[] for _ in expected_columns]
+        # Line numbers are derivable from position while the chunk is
+        # clean; the explicit list is materialized only once a row drops.
+        first_line = 2
+        kept = 0
+        lines: Optional[List[int]] = None
+        errors: List[RowError] = []
         invalid_count = 0
 
+        column_count = len(expected_columns)
+        # The generated parser is straight-line code for the happy path;
+        # only rows it rejects re-enter the column-by-column loop to name
+        # the bad field.
+        row_parser = _build_row_parser(dataset, config)
         for line_number, row in enumerate(reader, start=2):
-            row_valid = True
-            typed_row = {}
-            for col in expected_columns:
-                value = row[col]
-                parser = parsers.get(col)
-                if parser:
-                    try:
-                        typed_row[col] = parser(value)
-                    except Exception as exc:  # pylint: disable=broad-except
-                        row_valid = False
-                        invalid_count += 1
-                        log_row_error(dataset, line_number, f"{col}: {exc}")
-                        break
-                else:
-                    typed_row[col] = value
-            if row_valid:
-                typed_row["_line"] = line_number
-                valid_rows.append(typed_row)
-
-    logging.info(
-        "%s | %s | schema validation complete | valid=%d | invalid=%d",
-        utc_now(),
+            if len(row) != column_count:
+                invalid_count += 1
+                if lines is None:
+                    lines = list(range(first_line, first_line + kept))
+                errors.append(
+                    (
+                        "%s | line=%d | expected %d fields, got %d",
+                        (dataset, line_number, column_count, len(row)),
+                    )
+                )
+                continue
+            try:
+                parsed = row_parser(row)
+            except Exception:  # pylint: disable=broad-except
+                invalid_count += 1
+                if lines is None:
+                    lines = list(range(first_line, first_line + kept))
+                errors.append(
+                    (
+                        "%s | line=%d | %s",
+                        (
+                            dataset,
+                            line_number,
+                            _failing_column(row, parser_tuple, expected_columns),
+                        ),
+                    )
+                )
+                continue
+            for out, value in zip(out_lists, parsed):
+                out.append(value)
+            if lines is not None:
+                lines.append(line_number)
+            kept += 1
+            if kept >= chunk_rows:
+                flush_row_errors(errors)
+                yield _as_table(
+                    expected_columns, parser_tuple, out_lists, first_line, kept, lines
+                ), invalid_count
+                out_lists = [[] for _ in expected_columns]
+                first_line = line_number + 1
+                kept = 0
+                lines = None
+                errors = []
+                invalid_count = 0
+
+        flush_row_errors(errors)
+        yield _as_table(
+            expected_columns, parser_tuple, out_lists, first_line, kept, lines
+        ), invalid_count
+
+
+def stream_schema_chunks(dataset: str, chunk_rows: int = CHUNK_ROWS):
+    """Yield (table, invalid_count) chunks of at most chunk_rows rows.
+
+    The csv path holds one chunk of parsed values at a time, so memory
+    stays O(chunk_rows) however large the file is. The numba fast path
+    parses usage_logs into packed numeric arrays up front — a few bytes
+    per row — and decodes the timestamp column lazily per chunk, so
+    per-row Python objects are likewise bounded by chunk_rows.
+    """
+    config = SCHEMA_CONFIG[dataset]
+    path: Path = config["path"]
+    if not path.exists():
+        raise FileNotFoundError(f"Required dataset missing: {dataset} -> {path}")
+
+    # usage_logs is by far the largest file; when numba is available its
+    # numeric columns parse in a compiled pass over the raw bytes.
+    if dataset == "usage_logs" and _fast_csv.HAVE_NUMBA and path.stat().st_size:
+        yield from _iter_usage_fast_chunks(config, chunk_rows)
+        return
+
+    yield from _iter_csv_chunks(dataset, config, chunk_rows)
+
+
+def load_and_validate_schema(dataset: str) -> Tuple[DatasetRows, int]:
+    chunks: List[DatasetRows] = []
+    invalid_count = 0
+    for table, chunk_invalid in stream_schema_chunks(dataset):
+        chunks.append(table)
+        invalid_count += chunk_invalid
+    if len(chunks) == 1:
+        table = chunks[0]
+    else:
+        table = {
+            col: np.concatenate([chunk[col] for chunk in chunks])
+            for col in chunks[0]
+        }
+    logger.info(
+        "%s | schema validation complete | valid=%d | invalid=%d",
         dataset,
-        len(valid_rows),
+        row_count(table),
         invalid_count,
     )
-    return valid_rows, invalid_count
+    return table, invalid_count
 
 
 def validate_subscriptions_logic(rows: DatasetRows) -> Tuple[DatasetRows, int]:
-    valid: DatasetRows = []
-    invalid = 0
-    for row in rows:
-        start_date = row["start_date"]
-        end_date = row["end_date"]
-        if end_date and start_date > end_date:
-            invalid += 1
-            log_row_error(
-                "subscriptions",
-                row["_line"],
-                f"start_date {start_date} after end_date {end_date}",
+    total = row_count(rows)
+    start_arr = rows["start_date"]
+    end_arr = rows["end_date"]
+    # datetime64[D] columns compare as epoch-day ints; NaT marks open-ended
+    # subscriptions, which can't be invalid.
+    bad = ~np.isnat(end_arr) & (start_arr > end_arr)
+    invalid = int(bad.sum())
+    if invalid:
+        line_arr = rows["_line"]
+        errors: List[RowError] = [
+            (
+                "subscriptions | line=%d | start_date %s after end_date %s",
+                (line_arr[idx], start_arr[idx], end_arr[idx]),
             )
-            continue
-        valid.append(row)
-    logging.info(
-        "%s | subscriptions | logical validation complete | valid=%d | invalid=%d",
-        utc_now(),
-        len(valid),
+            for idx in np.flatnonzero(bad)
+        ]
+        flush_row_errors(errors)
+        valid = {col: arr[~bad] for col, arr in rows.items()}
+    else:
+        valid = rows
+    logger.info(
+        "subscriptions | logical validation complete | valid=%d | invalid=%d",
+        total - invalid,
         invalid,
     )
     return valid, invalid
 
 
+def build_duration_lut(content_ids: np.ndarray, durations: np.ndarray) -> np.ndarray:
+    """Build a dense content_id -> duration array; -1 marks unknown ids.
+
+    Generated content ids are small and dense, so the array costs little
+    and turns every duration lookup into an indexed load.
+    """
+    if not content_ids.size:
+        return np.empty(0, dtype=np.int64)
+    lut = np.full(int(content_ids.max()) + 1, -1, dtype=np.int64)
+    lut[content_ids] = durations
+    return lut
+
+
 def validate_usage_rules(
     rows: DatasetRows,
-    customer_ids: set[int],
-    content_duration: Dict[int, int],
+    customer_ids: np.ndarray,
+    duration_lut: np.ndarray,
 ) -> Tuple[DatasetRows, int]:
-    valid: DatasetRows = []
+    """Check usage rows against referential and range rules.
+
+    customer_ids must be a sorted int64 array; membership is a vectorized
+    binary search rather than a Python set probe per row. duration_lut is
+    a dense array indexed by content_id with -1 marking unknown ids (see
+    build_duration_lut), so a duration lookup is one indexed load.
+    """
+    total = row_count(rows)
     invalid = 0
-    for row in rows:
-        errors: List[str] = []
-        if row["customer_id"] not in customer_ids:
-            errors.append(f"unknown customer_id {row['customer_id']}")
-        duration = content_duration.get(row["content_id"])
-        if duration is None:
-            errors.append(f"unknown content_id {row['content_id']}")
+    if total:
+        # The columnar table already holds the rule columns as packed
+        # arrays; the checks are a handful of vectorized comparisons and
+        # only failing rows re-enter Python.
+        cust_arr = rows["customer_id"]
+        content_arr = rows["content_id"]
+        watched_arr = rows["duration_watched"]
+        completion_arr = rows["completion_rate"]
+
+        if customer_ids.size:
+            pos = np.minimum(
+                np.searchsorted(customer_ids, cust_arr), customer_ids.size - 1
+            )
+            cust_ok = customer_ids[pos] == cust_arr
         else:
-            if row["duration_watched"] > duration:
+            cust_ok = np.zeros(total, dtype=bool)
+
+        max_id = duration_lut.size
+        if max_id:
+            in_range = (content_arr >= 0) & (content_arr < max_id)
+            lookup = duration_lut[np.clip(content_arr, 0, max_id - 1)]
+            content_ok = in_range & (lookup >= 0)
+            watched_ok = content_ok & (watched_arr <= lookup)
+        else:
+            content_ok = np.zeros(total, dtype=bool)
+            watched_ok = content_ok
+        completion_ok = (completion_arr >= 0.0) & (completion_arr <= 1.0)
+
+        row_ok = cust_ok & watched_ok & completion_ok
+        invalid = int(total - int(row_ok.sum()))
+
+        # Skip the per-row message interpolation entirely when error
+        # records would be dropped anyway.
+        errors: List[RowError] = []
+        line_arr = rows["_line"]
+        for idx in np.flatnonzero(~row_ok) if logger.isEnabledFor(logging.ERROR) else ():
+            line = line_arr[idx]
+            if not cust_ok[idx]:
                 errors.append(
-                    f"duration_watched {row['duration_watched']} exceeds content duration {duration}"
+                    ("usage_logs | line=%d | unknown customer_id %d", (line, cust_arr[idx]))
                 )
-        if not 0 <= row["completion_rate"] <= 1:
-            errors.append(
-                f"completion_rate {row['completion_rate']} outside 0-1 range"
-            )
-
-        if errors:
-            invalid += 1
-            for err in errors:
-                log_row_error("usage_logs", row["_line"], err)
-            continue
-        valid.append(row)
-
-    logging.info(
-        "%s | usage_logs | referential/logical validation complete | valid=%d | invalid=%d",
-        utc_now(),
-        len(valid),
+            if not content_ok[idx]:
+                errors.append(
+                    ("usage_logs | line=%d | unknown content_id %d", (line, content_arr[idx]))
+                )
+            elif not watched_ok[idx]:
+                errors.append(
+                    (
+                        "usage_logs | line=%d | duration_watched %d exceeds "
+                        "content duration %d",
+                        (line, watched_arr[idx], duration_lut[int(content_arr[idx])]),
+                    )
+                )
+            if not completion_ok[idx]:
+                errors.append(
+                    (
+                        "usage_logs | line=%d | completion_rate %s outside 0-1 range",
+                        (line, completion_arr[idx]),
+                    )
+                )
+        flush_row_errors(errors)
+        valid = {col: arr[row_ok] for col, arr in rows.items()} if invalid else rows
+    else:
+        valid = rows
+
+    logger.info(
+        "usage_logs | referential/logical validation complete | valid=%d | invalid=%d",
+        total - invalid,
         invalid,
     )
     return valid, invalid
@@ -259,40 +641,60 @@ def validate_usage_rules(
 def run_validations() -> None:
     summary: Dict[str, Dict[str, int]] = {}
 
-    customers, cust_invalid = load_and_validate_schema("customers")
-    summary["customers"] = {"valid": len(customers), "invalid": cust_invalid}
-
-    plans, plans_invalid = load_and_validate_schema("plans")
-    summary["plans"] = {"valid": len(plans), "invalid": plans_invalid}
+    # The four reference datasets are independent and small, so each parses
+    # in its own worker process; the rows pickle cheaply back to the
+    # parent. usage_logs is streamed in chunks below instead of being
+    # materialized whole. The logical validations stay in-process — they
+    # are vectorized and not worth a second round of pickling. Workers
+    # configure logging themselves: under the spawn start method they
+    # inherit no handlers from the parent.
+    with ProcessPoolExecutor(max_workers=4, initializer=init_logging) as pool:
+        futures = {
+            dataset: pool.submit(load_and_validate_schema, dataset)
+            for dataset in ("customers", "plans", "content", "subscriptions")
+        }
+        customers, cust_invalid = futures["customers"].result()
+        plans, plans_invalid = futures["plans"].result()
+        content, content_invalid = futures["content"].result()
+        subscriptions, subs_invalid = futures["subscriptions"].result()
+
+    summary["customers"] = {"valid": row_count(customers), "invalid": cust_invalid}
+    summary["plans"] = {"valid": row_count(plans), "invalid": plans_invalid}
+    summary["content"] = {"valid": row_count(content), "invalid": content_invalid}
 
-    content, content_invalid = load_and_validate_schema("content")
-    summary["content"] = {"valid": len(content), "invalid": content_invalid}
-
-    subscriptions, subs_invalid = load_and_validate_schema("subscriptions")
     subscriptions, subs_logic_invalid = validate_subscriptions_logic(subscriptions)
     summary["subscriptions"] = {
-        "valid": len(subscriptions),
+        "valid": row_count(subscriptions),
         "invalid": subs_invalid + subs_logic_invalid,
     }
 
-    usage_logs, usage_invalid = load_and_validate_schema("usage_logs")
-
-    customer_ids = {row["customer_id"] for row in customers}
-    content_duration = {row["content_id"]: row["duration_minutes"] for row in content}
+    customer_ids = np.sort(customers["customer_id"])
+    duration_lut = build_duration_lut(
+        content["content_id"], content["duration_minutes"]
+    )
 
-    usage_logs, usage_logic_invalid = validate_usage_rules(
-        usage_logs, customer_ids, content_duration
+    # Stream usage_logs chunk by chunk and keep only the running counts;
+    # the full file never has to fit in memory at once.
+    usage_valid = 0
+    usage_invalid = 0
+    for chunk, schema_invalid in stream_schema_chunks("usage_logs"):
+        chunk, logic_invalid = validate_usage_rules(chunk, customer_ids, duration_lut)
+        usage_valid += row_count(chunk)
+        usage_invalid += schema_invalid + logic_invalid
+    logger.info(
+        "usage_logs | streamed validation complete | valid=%d | invalid=%d",
+        usage_valid,
+        usage_invalid,
     )
     summary["usage_logs"] = {
-        "valid": len(usage_logs),
-        "invalid": usage_invalid + usage_logic_invalid,
+        "valid": usage_valid,
+        "invalid": usage_invalid,
     }
 
-    logging.info("%s | validation summary", utc_now())
+    logger.info("validation summary")
     for dataset, stats in summary.items():
-        logging.info(
-            "%s | %s | valid=%d | invalid=%d",
-            utc_now(),
+        logger.info(
+            "%s | valid=%d | invalid=%d",
             dataset,
             stats["valid"],
             stats["invalid"],
@@ -301,9 +703,9 @@ def run_validations() -> None:
 
 def main() -> None:
     init_logging()
-    logging.info("%s | validation run started", utc_now())
+    logger.info("validation run started")
     run_validations()
-    logging.info("%s | validation run completed", utc_now())
+    logger.info("validation run completed")
 
 
 if __name__ == "__main__":